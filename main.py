@@ -1,24 +1,54 @@
 from fastapi import FastAPI, Request, Query, HTTPException
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
-from datetime import datetime, timedelta
+from datetime import datetime
+from pathlib import Path
 from typing import Optional, List
+import asyncio
+import hashlib
 import json
+import orjson
 import re
 import os
+import threading
+import numpy as np
 from collections import defaultdict
+from functools import lru_cache
+
+try:
+    import hyperscan
+except ImportError:  # optional, categorization falls back to the compiled re patterns
+    hyperscan = None
 
 app = FastAPI()
 
+def orjson_response(payload) -> Response:
+    """Serialize with orjson directly, skipping FastAPI's jsonable_encoder pass.
+    
+    For the large read endpoints; payloads must hold only plain JSON types.
+    """
+    return Response(orjson.dumps(payload), media_type="application/json")
+
 # ============================================================================
 # DATABASE SIMULATION (will move to PostgreSQL)
 # ============================================================================
 companies = {}  # company_id -> company data
 transactions = {}  # company_id -> list of transactions
+txn_columns = {}  # company_id -> columnar (numpy) view of transactions, row i = transactions[i]
+txn_index = {}  # company_id -> {txn_id: row in transactions / txn_columns}
 groups = {}  # company_id -> list of transaction groups
+group_index = {}  # company_id -> {group_id: group}
 forecasts = {}  # company_id -> forecast data
 trend_settings = {}  # company_id -> trend adjustments
 
+def build_txn_columns(txns: list) -> dict:
+    """Build parallel numpy arrays over a company's transactions for vectorized scans"""
+    return {
+        "date": np.array([t["date"] for t in txns], dtype="datetime64[D]"),
+        "amount": np.array([t["amount"] for t in txns], dtype=np.float64),
+        "group_id": np.array([t["group_id"] for t in txns], dtype=object),
+    }
+
 # Default categories
 DEFAULT_CATEGORIES = [
     {"id": "payroll", "name": "Payroll", "icon": "💰", "frequency": "semi-monthly"},
@@ -40,6 +70,7 @@ DEFAULT_CATEGORIES = [
     {"id": "refunds", "name": "Refunds", "icon": "↩️", "frequency": "daily"},
     {"id": "unassigned", "name": "Unassigned", "icon": "❓", "frequency": "unknown"},
 ]
+_CATEGORY_BY_ID = {c["id"]: c for c in DEFAULT_CATEGORIES}
 
 FREQUENCY_OPTIONS = [
     {"id": "daily", "name": "Daily (most business days)", "multiplier": 22},
@@ -51,6 +82,8 @@ FREQUENCY_OPTIONS = [
     {"id": "varies", "name": "Varies", "multiplier": 1},
 ]
 
+_DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
 # ============================================================================
 # ONBOARDING ENDPOINTS
 # ============================================================================
@@ -72,7 +105,10 @@ async def create_company(request: Request):
         "setup_step": "data_upload"
     }
     transactions[company_id] = []
+    txn_columns[company_id] = build_txn_columns([])
+    txn_index[company_id] = {}
     groups[company_id] = []
+    group_index[company_id] = {}
     
     return {"success": True, "company_id": company_id, "access_code": company_id[:6]}
 
@@ -104,21 +140,39 @@ async def fetch_branding(company_id: str, request: Request):
 
 @app.post("/api/company/{company_id}/import-data")
 async def import_data(company_id: str, request: Request):
-    """Import bank transaction data"""
+    """Import bank transaction data sent as JSON {"data": "..."}.
+    
+    Slow path kept for existing clients: the whole dump is decoded as JSON before
+    parsing. Prefer import-data-raw for large imports.
+    """
     if company_id not in companies:
         raise HTTPException(status_code=404, detail="Company not found")
     
-    data = await request.json()
-    raw_data = data.get("data", "")
-    
-    parsed = parse_bank_data(raw_data)
+    data = orjson.loads(await request.body())
+    return await store_import(company_id, data.get("data", ""))
+
+@app.post("/api/company/{company_id}/import-data-raw")
+async def import_data_raw(company_id: str, request: Request):
+    """Import bank transaction data sent as a text/plain body, no JSON wrapper"""
+    if company_id not in companies:
+        raise HTTPException(status_code=404, detail="Company not found")
     
-    # Store transactions
+    raw_data = (await request.body()).decode("utf-8", errors="replace")
+    return await store_import(company_id, raw_data)
+
+async def store_import(company_id: str, raw_data: str) -> dict:
+    """Parse, categorize and store a bank data dump, returning the import summary"""
+    # Parsing and categorizing are CPU-bound, keep them off the event loop. The
+    # worker only touches objects it created, other requests keep seeing the
+    # previous import until the stores are swapped below.
+    parsed, columns, rows_by_id, auto_groups, groups_by_id = await asyncio.to_thread(build_import, raw_data)
+    
+    # Store transactions and groups together, no await until all are in place
     transactions[company_id] = parsed["transactions"]
-    
-    # Auto-categorize
-    auto_groups = auto_categorize_transactions(parsed["transactions"])
+    txn_columns[company_id] = columns
+    txn_index[company_id] = rows_by_id
     groups[company_id] = auto_groups
+    group_index[company_id] = groups_by_id
     
     # Update setup step
     companies[company_id]["setup_step"] = "categorization"
@@ -133,89 +187,110 @@ async def import_data(company_id: str, request: Request):
         }
     }
 
+def build_import(raw_data: str) -> tuple:
+    """Parse and auto-categorize a bank data dump into fresh store values.
+    
+    Returns (parsed, txn_columns, txn_index, groups, group_index) for one company.
+    """
+    parsed = parse_bank_data(raw_data)
+    txns = parsed["transactions"]
+    auto_groups = auto_categorize_transactions(txns)
+    return (
+        parsed,
+        build_txn_columns(txns),
+        {t["id"]: i for i, t in enumerate(txns)},
+        auto_groups,
+        {g["id"]: g for g in auto_groups},
+    )
+
+# Date header formats, tried in order: JAN 13, 2026 / 01/13/2026 / 2026-01-13
+_DATE_HEADER_RE = re.compile(
+    r'^(?:(?P<mon_name>[A-Z]{3})\s+(?P<mon_day>\d{1,2}),?\s*(?P<mon_year>\d{4})'
+    r'|(?P<us_month>\d{1,2})/(?P<us_day>\d{1,2})/(?P<us_year>\d{4})'
+    r'|(?P<iso_year>\d{4})-(?P<iso_month>\d{2})-(?P<iso_day>\d{2}))',
+    re.IGNORECASE,
+)
+_MONTHS = {'JAN':1,'FEB':2,'MAR':3,'APR':4,'MAY':5,'JUN':6,
+           'JUL':7,'AUG':8,'SEP':9,'OCT':10,'NOV':11,'DEC':12}
+
+def parse_date_header(match) -> Optional[datetime]:
+    """Build a datetime from a _DATE_HEADER_RE match, or None if it isn't a real date"""
+    try:
+        if match.group("mon_name"):
+            month = _MONTHS.get(match.group("mon_name").upper())
+            if month is None:
+                return None
+            return datetime(int(match.group("mon_year")), month, int(match.group("mon_day")))
+        if match.group("us_month"):
+            return datetime(int(match.group("us_year")), int(match.group("us_month")), int(match.group("us_day")))
+        return datetime(int(match.group("iso_year")), int(match.group("iso_month")), int(match.group("iso_day")))
+    except ValueError:
+        return None
+
+# Transaction line columns are separated by tabs or runs of 2+ spaces
+_SPLIT_RE = re.compile(r'\t+|\s{2,}')
+_STRIP_TABLE = str.maketrans('', '', '$,')
+# Signed plain decimals (matched against stripped columns), all of which float() accepts
+_AMOUNT_RE = re.compile(r'[-+]?(?:\d+\.?\d*|\.\d+)')
+
 def parse_bank_data(raw_data: str) -> dict:
     """Parse messy bank data into structured transactions"""
     transactions = []
-    current_date = None
+    current_date = datetime.now().strftime("%Y-%m-%d")  # until the first date header
+    date_cache = {}  # header line -> formatted date, statements repeat headers
     
     lines = raw_data.strip().split('\n')
     
-    # Date patterns
-    date_patterns = [
-        r'^([A-Z]{3})\s+(\d{1,2}),?\s*(\d{4})',  # JAN 13, 2026
-        r'^(\d{1,2})/(\d{1,2})/(\d{4})',  # 01/13/2026
-        r'^(\d{4})-(\d{2})-(\d{2})',  # 2026-01-13
-    ]
-    
     for line in lines:
         line = line.strip()
         if not line:
             continue
         
         # Check for date header
-        date_match = None
-        for pattern in date_patterns:
-            match = re.match(pattern, line, re.IGNORECASE)
-            if match:
-                date_match = match
-                break
+        cached_date = date_cache.get(line)
+        if cached_date:
+            current_date = cached_date
+            continue
         
+        date_match = _DATE_HEADER_RE.match(line)
         if date_match:
-            # Parse date
-            try:
-                if 'JAN' in line.upper() or 'FEB' in line.upper():
-                    # Month name format
-                    month_name = date_match.group(1).upper()
-                    day = int(date_match.group(2))
-                    year = int(date_match.group(3))
-                    months = {'JAN':1,'FEB':2,'MAR':3,'APR':4,'MAY':5,'JUN':6,
-                             'JUL':7,'AUG':8,'SEP':9,'OCT':10,'NOV':11,'DEC':12}
-                    current_date = datetime(year, months.get(month_name, 1), day)
-                elif '/' in line:
-                    current_date = datetime.strptime(f"{date_match.group(1)}/{date_match.group(2)}/{date_match.group(3)}", "%m/%d/%Y")
-                else:
-                    current_date = datetime.strptime(f"{date_match.group(1)}-{date_match.group(2)}-{date_match.group(3)}", "%Y-%m-%d")
-            except:
-                pass
+            header_date = parse_date_header(date_match)
+            if header_date:
+                current_date = date_cache[line] = header_date.strftime("%Y-%m-%d")
             continue
         
         # Try to parse transaction line (tab or multiple-space separated)
-        parts = re.split(r'\t+|\s{2,}', line)
-        if len(parts) >= 3:
-            try:
-                description = parts[0] if len(parts[0]) > 5 else parts[1] if len(parts) > 1 else parts[0]
-                
-                # Find amounts (look for numbers with optional $ and commas)
-                amounts = []
-                for part in parts:
-                    cleaned = re.sub(r'[$,]', '', part)
-                    try:
-                        amt = float(cleaned)
-                        amounts.append(amt)
-                    except:
-                        pass
-                
-                if amounts:
-                    # Determine if debit or credit
-                    # Convention: if there are two amount columns, first is debit, second is credit
-                    if len(amounts) >= 2:
-                        debit = amounts[0] if amounts[0] > 0 else 0
-                        credit = amounts[1] if len(amounts) > 1 and amounts[1] > 0 else 0
-                        amount = credit - debit if credit else -debit
-                    else:
-                        amount = amounts[0]
-                    
-                    transactions.append({
-                        "id": len(transactions) + 1,
-                        "date": current_date.strftime("%Y-%m-%d") if current_date else datetime.now().strftime("%Y-%m-%d"),
-                        "description": description.strip(),
-                        "amount": amount,
-                        "type": "credit" if amount > 0 else "debit",
-                        "group_id": None,
-                        "category_id": "unassigned"
-                    })
-            except Exception as e:
-                pass
+        parts = _SPLIT_RE.split(line)
+        if len(parts) < 3:
+            continue
+        
+        description = parts[0] if len(parts[0]) > 5 else parts[1]
+        
+        # Find amounts (look for numbers with optional $ and commas)
+        amounts = []
+        for part in parts:
+            cleaned = part.translate(_STRIP_TABLE).strip()
+            if _AMOUNT_RE.fullmatch(cleaned):
+                amounts.append(float(cleaned))
+        
+        if not amounts:
+            continue
+        
+        # Convention: if there are two amount columns, first is debit, second is credit
+        if len(amounts) >= 2:
+            amount = max(amounts[1], 0.0) - max(amounts[0], 0.0)
+        else:
+            amount = amounts[0]
+        
+        transactions.append({
+            "id": len(transactions) + 1,
+            "date": current_date,
+            "description": description.strip(),
+            "amount": amount,
+            "type": "credit" if amount > 0 else "debit",
+            "group_id": None,
+            "category_id": "unassigned"
+        })
     
     dates = [t["date"] for t in transactions]
     return {
@@ -224,74 +299,124 @@ def parse_bank_data(raw_data: str) -> dict:
         "end_date": max(dates) if dates else None
     }
 
+# Pattern matching for common transaction types, in priority order
+_CATEGORY_PATTERNS = [
+    (r'PAYROLL|PAYCHEX|ADP|GUSTO', 'payroll', 'Payroll'),
+    (r'401K|RETIREMENT|PENSION', 'payroll_tax', 'Payroll Taxes & Benefits'),
+    (r'RENT|LEASE', 'rent', 'Rent'),
+    (r'ELECTRIC|GAS|WATER|UTILITY|PG&E|EDISON', 'utilities', 'Utilities'),
+    (r'INSURANCE|GEICO|STATE FARM|BLUE CROSS|BLUE SHIELD', 'insurance', 'Insurance'),
+    (r'AMEX|VISA|MASTERCARD|DISCOVER|CHASE CARD', 'credit_card', 'Credit Card'),
+    (r'LOAN|MORTGAGE|LENDING', 'loan', 'Loan Payment'),
+    (r'AMAZON|OFFICE DEPOT|STAPLES|SUPPLY', 'daily_ops', 'Office & Supplies'),
+    (r'REFUND|RETURN', 'refunds', 'Refunds'),
+    (r'DEPOSIT|MERCHANT|STRIPE|SQUARE|AUTHORIZE', 'sales_revenue', 'Sales Revenue'),
+    (r'TRANSFER|WIRE|ACH', 'other_revenue', 'Bank Transfers'),
+    (r'TAX|IRS|FTB|FRANCHISE', 'taxes', 'Taxes'),
+    (r'ATTORNEY|LAWYER|CPA|ACCOUNTANT', 'legal_accounting', 'Legal & Accounting'),
+    (r'GOOGLE ADS|FACEBOOK|META|MARKETING|ADVERTIS', 'marketing', 'Marketing'),
+    (r'QUICKBOOKS|SLACK|ZOOM|ADOBE|MICROSOFT|SUBSCRIPTION', 'subscriptions', 'Software'),
+]
+# Compiled once; matched against the uppercased description, first hit wins
+_CATEGORY_REGEXES = [(re.compile(p), cat_id, cat_name) for p, cat_id, cat_name in _CATEGORY_PATTERNS]
+
+# Same patterns as a Hyperscan database when the library is installed. Pattern
+# ids are list positions, so the lowest id reported is the highest-priority hit.
+_CATEGORY_DB = None
+_CATEGORY_DB_LOCK = threading.Lock()  # the database's scratch space is single-threaded
+if hyperscan is not None:
+    _CATEGORY_DB = hyperscan.Database()
+    _CATEGORY_DB.compile(
+        expressions=[p.encode() for p, _, _ in _CATEGORY_PATTERNS],
+        ids=list(range(len(_CATEGORY_PATTERNS))),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(_CATEGORY_PATTERNS),
+    )
+
+@lru_cache(maxsize=8192)
+def _classify(desc: str) -> tuple:
+    """Return (cat_id, cat_name) for an uppercased description, or (None, None) if no pattern matches"""
+    if _CATEGORY_DB is not None:
+        hits = []
+        
+        def on_match(pattern_id, start, end, flags, context):
+            hits.append(pattern_id)
+        
+        with _CATEGORY_DB_LOCK:
+            _CATEGORY_DB.scan(desc.encode(), match_event_handler=on_match)
+        if hits:
+            _, cat_id, cat_name = _CATEGORY_PATTERNS[min(hits)]
+            return cat_id, cat_name
+        return None, None
+    
+    for regex, cat_id, cat_name in _CATEGORY_REGEXES:
+        if regex.search(desc):
+            return cat_id, cat_name
+    return None, None
+
 def auto_categorize_transactions(txns: list) -> list:
     """Auto-detect transaction groups based on patterns"""
     groups = []
-    grouped_txns = defaultdict(list)
-    
-    for txn in txns:
-        desc = txn["description"].upper()
-        amount = txn["amount"]
+    bucket_of = {}  # category -> bucket number, in first-seen order
+    buckets = []
+    unmatched = []  # rows no pattern matched, clustered by amount below
+    
+    for row, txn in enumerate(txns):
+        # Bank exports repeat the same merchants, so most lookups are cache hits
+        cat_id, cat_name = _classify(txn["description"].upper())
+        if cat_id:
+            txn["category_id"] = cat_id
+            buckets.append(bucket_of.setdefault(cat_id, len(bucket_of)))
+        else:
+            buckets.append(-1)
+            unmatched.append(row)
+    
+    # Descriptions are specific to this import, don't keep them around
+    _classify.cache_clear()
+    
+    buckets = np.array(buckets, dtype=np.int64)
+    amounts = np.array([t["amount"] for t in txns], dtype=np.float64)
+    n_buckets = len(bucket_of)
+    
+    if unmatched:
+        # Group unmatched by similar amounts: nearest 10, same direction
+        rows = np.array(unmatched)
+        keys = np.column_stack((np.round(np.abs(amounts[rows]), -1), amounts[rows] > 0))
+        clusters, cluster_of = np.unique(keys, axis=0, return_inverse=True)
+        buckets[rows] = n_buckets + cluster_of.reshape(-1)
+        n_buckets += len(clusters)
+    
+    # Per-bucket sizes, totals and member rows in a few array passes
+    counts = np.bincount(buckets, minlength=n_buckets)
+    sums = np.bincount(buckets, weights=amounts, minlength=n_buckets)
+    members = np.split(np.argsort(buckets, kind="stable"), np.cumsum(counts)[:-1])
+    
+    # Create group objects, in order of each group's first transaction
+    multi = np.flatnonzero(counts >= 2)  # Only create groups with multiple transactions
+    for bucket in sorted(multi.tolist(), key=lambda b: members[b][0]):
+        txn_list = [txns[i] for i in members[bucket]]
+        sum_amount = float(sums[bucket])
+        frequency = detect_frequency(txn_list)
         
-        # Pattern matching for common transaction types
-        patterns = [
-            (r'PAYROLL|PAYCHEX|ADP|GUSTO', 'payroll', 'Payroll'),
-            (r'401K|RETIREMENT|PENSION', 'payroll_tax', 'Payroll Taxes & Benefits'),
-            (r'RENT|LEASE', 'rent', 'Rent'),
-            (r'ELECTRIC|GAS|WATER|UTILITY|PG&E|EDISON', 'utilities', 'Utilities'),
-            (r'INSURANCE|GEICO|STATE FARM|BLUE CROSS|BLUE SHIELD', 'insurance', 'Insurance'),
-            (r'AMEX|VISA|MASTERCARD|DISCOVER|CHASE CARD', 'credit_card', 'Credit Card'),
-            (r'LOAN|MORTGAGE|LENDING', 'loan', 'Loan Payment'),
-            (r'AMAZON|OFFICE DEPOT|STAPLES|SUPPLY', 'daily_ops', 'Office & Supplies'),
-            (r'REFUND|RETURN', 'refunds', 'Refunds'),
-            (r'DEPOSIT|MERCHANT|STRIPE|SQUARE|AUTHORIZE', 'sales_revenue', 'Sales Revenue'),
-            (r'TRANSFER|WIRE|ACH', 'other_revenue', 'Bank Transfers'),
-            (r'TAX|IRS|FTB|FRANCHISE', 'taxes', 'Taxes'),
-            (r'ATTORNEY|LAWYER|CPA|ACCOUNTANT', 'legal_accounting', 'Legal & Accounting'),
-            (r'GOOGLE ADS|FACEBOOK|META|MARKETING|ADVERTIS', 'marketing', 'Marketing'),
-            (r'QUICKBOOKS|SLACK|ZOOM|ADOBE|MICROSOFT|SUBSCRIPTION', 'subscriptions', 'Software'),
-        ]
+        # Get category from first transaction
+        cat_id = txn_list[0].get("category_id", "unassigned")
+        cat_name = _CATEGORY_BY_ID.get(cat_id, {"name": "Unassigned"})["name"]
         
-        matched = False
-        for pattern, cat_id, cat_name in patterns:
-            if re.search(pattern, desc):
-                key = f"{cat_id}_{cat_name}"
-                grouped_txns[key].append(txn)
-                txn["category_id"] = cat_id
-                matched = True
-                break
+        group = {
+            "id": f"grp_{len(groups)+1}",
+            "name": cat_name if cat_id != "unassigned" else f"Group {len(groups)+1}",
+            "category_id": cat_id,
+            "frequency": frequency,
+            "avg_amount": sum_amount / len(txn_list),
+            "sum_amount": sum_amount,
+            "transaction_count": len(txn_list),
+            "transaction_ids": [t["id"] for t in txn_list],
+            "confirmed": False
+        }
+        groups.append(group)
         
-        if not matched:
-            # Group by similar amounts for unmatched
-            rounded_amt = round(abs(amount), -1)  # Round to nearest 10
-            key = f"amount_{rounded_amt}_{txn['type']}"
-            grouped_txns[key].append(txn)
-    
-    # Create group objects
-    for key, txn_list in grouped_txns.items():
-        if len(txn_list) >= 2:  # Only create groups with multiple transactions
-            avg_amount = sum(t["amount"] for t in txn_list) / len(txn_list)
-            frequency = detect_frequency(txn_list)
-            
-            # Get category from first transaction
-            cat_id = txn_list[0].get("category_id", "unassigned")
-            cat_name = next((c["name"] for c in DEFAULT_CATEGORIES if c["id"] == cat_id), "Unassigned")
-            
-            group = {
-                "id": f"grp_{len(groups)+1}",
-                "name": cat_name if cat_id != "unassigned" else f"Group {len(groups)+1}",
-                "category_id": cat_id,
-                "frequency": frequency,
-                "avg_amount": avg_amount,
-                "transaction_count": len(txn_list),
-                "transaction_ids": [t["id"] for t in txn_list],
-                "confirmed": False
-            }
-            groups.append(group)
-            
-            # Update transactions with group_id
-            for t in txn_list:
-                t["group_id"] = group["id"]
+        # Update transactions with group_id
+        for t in txn_list:
+            t["group_id"] = group["id"]
     
     return groups
 
@@ -300,11 +425,11 @@ def detect_frequency(txns: list) -> str:
     if len(txns) < 2:
         return "uncommon"
     
-    dates = sorted([datetime.strptime(t["date"], "%Y-%m-%d") for t in txns])
+    dates = np.array([t["date"] for t in txns], dtype="datetime64[D]")
+    dates.sort()
     
     # Calculate average days between transactions
-    gaps = [(dates[i+1] - dates[i]).days for i in range(len(dates)-1)]
-    avg_gap = sum(gaps) / len(gaps) if gaps else 30
+    avg_gap = float(np.diff(dates).astype(np.int64).mean())
     
     if avg_gap <= 2:
         return "daily"
@@ -329,11 +454,11 @@ async def get_groups(company_id: str):
     if company_id not in companies:
         raise HTTPException(status_code=404, detail="Company not found")
     
-    return {
+    return orjson_response({
         "groups": groups.get(company_id, []),
         "categories": DEFAULT_CATEGORIES,
         "frequencies": FREQUENCY_OPTIONS
-    }
+    })
 
 @app.get("/api/company/{company_id}/group/{group_id}")
 async def get_group_detail(company_id: str, group_id: str):
@@ -341,24 +466,25 @@ async def get_group_detail(company_id: str, group_id: str):
     if company_id not in groups:
         raise HTTPException(status_code=404, detail="Company not found")
     
-    group = next((g for g in groups[company_id] if g["id"] == group_id), None)
+    group = group_index[company_id].get(group_id)
     if not group:
         raise HTTPException(status_code=404, detail="Group not found")
     
     # Get transactions for this group
-    group_txns = [t for t in transactions[company_id] if t["group_id"] == group_id]
+    company_txns = transactions[company_id]
+    group_txns = [company_txns[i] for i in np.flatnonzero(txn_columns[company_id]["group_id"] == group_id)]
     
-    return {
+    return orjson_response({
         "group": group,
         "transactions": group_txns
-    }
+    })
 
 @app.post("/api/company/{company_id}/group/{group_id}/update")
 async def update_group(company_id: str, group_id: str, request: Request):
     """Update group name, category, frequency"""
     data = await request.json()
     
-    group = next((g for g in groups[company_id] if g["id"] == group_id), None)
+    group = group_index[company_id].get(group_id)
     if not group:
         raise HTTPException(status_code=404, detail="Group not found")
     
@@ -389,40 +515,54 @@ async def move_transactions(company_id: str, request: Request):
             "category_id": data.get("category_id", "unassigned"),
             "frequency": data.get("frequency", "varies"),
             "avg_amount": 0,
+            "sum_amount": 0,
             "transaction_count": 0,
             "transaction_ids": [],
             "confirmed": False
         }
         groups[company_id].append(new_group)
+        group_index[company_id][new_group["id"]] = new_group
         target_group_id = new_group["id"]
     
-    # Move transactions
+    # Move transactions, visiting them in stored order
+    company_txns = transactions[company_id]
+    group_by_id = group_index[company_id]
+    group_col = txn_columns[company_id]["group_id"]
+    new_group = group_by_id.get(target_group_id)
+    rows = sorted({txn_index[company_id][i] for i in txn_ids if i in txn_index[company_id]})
+    
     moved = 0
-    for txn in transactions[company_id]:
-        if txn["id"] in txn_ids:
-            old_group_id = txn["group_id"]
-            txn["group_id"] = target_group_id
-            
-            # Update old group
-            if old_group_id:
-                old_group = next((g for g in groups[company_id] if g["id"] == old_group_id), None)
-                if old_group and txn["id"] in old_group["transaction_ids"]:
-                    old_group["transaction_ids"].remove(txn["id"])
-                    old_group["transaction_count"] -= 1
-            
-            # Update new group
-            new_group = next((g for g in groups[company_id] if g["id"] == target_group_id), None)
-            if new_group:
-                new_group["transaction_ids"].append(txn["id"])
-                new_group["transaction_count"] += 1
-            
-            moved += 1
-    
-    # Recalculate averages
-    for grp in groups[company_id]:
-        grp_txns = [t for t in transactions[company_id] if t["group_id"] == grp["id"]]
-        if grp_txns:
-            grp["avg_amount"] = sum(t["amount"] for t in grp_txns) / len(grp_txns)
+    removed = defaultdict(dict)  # old group_id -> {txn_id: amount} moved out of it
+    for row in rows:
+        txn = company_txns[row]
+        old_group_id = txn["group_id"]
+        moved += 1
+        if old_group_id == target_group_id:
+            continue
+        
+        txn["group_id"] = target_group_id
+        group_col[row] = target_group_id
+        if old_group_id:
+            removed[old_group_id][txn["id"]] = txn["amount"]
+        if new_group:
+            new_group["transaction_ids"].append(txn["id"])
+            new_group["transaction_count"] += 1
+            new_group["sum_amount"] += txn["amount"]
+    
+    # Update old groups in one pass each rather than list.remove per transaction
+    for old_group_id, moved_out in removed.items():
+        old_group = group_by_id.get(old_group_id)
+        if old_group:
+            kept = [i for i in old_group["transaction_ids"] if i not in moved_out]
+            old_group["transaction_count"] -= len(old_group["transaction_ids"]) - len(kept)
+            old_group["transaction_ids"] = kept
+            old_group["sum_amount"] -= sum(moved_out.values())
+    
+    # Refresh averages of the groups that changed from their running sums
+    for grp_id in [*removed, target_group_id]:
+        grp = group_by_id.get(grp_id)
+        if grp:
+            grp["avg_amount"] = grp["sum_amount"] / grp["transaction_count"] if grp["transaction_count"] else 0
     
     return {"success": True, "moved": moved}
 
@@ -439,70 +579,12 @@ async def get_forecast(company_id: str, days: int = 30):
     if company_id not in groups or not groups[company_id]:
         return {"error": "No transaction groups defined. Complete categorization first."}
     
-    # Build forecast model from groups
-    forecast_rows = []
-    balance = companies[company_id].get("current_balance", 0)
-    
-    today = datetime.now().date()
-    
-    for day_offset in range(days):
-        current_date = today + timedelta(days=day_offset)
-        day_name = current_date.strftime("%A")
-        is_weekend = day_name in ["Saturday", "Sunday"]
-        
-        daily_credits = 0
-        daily_debits = 0
-        transactions_today = []
-        
-        # Apply each group based on frequency
-        for grp in groups[company_id]:
-            if not grp.get("confirmed", False):
-                continue
-            
-            freq = grp["frequency"]
-            avg = grp["avg_amount"]
-            
-            should_apply = False
-            
-            if freq == "daily" and not is_weekend:
-                should_apply = True
-            elif freq == "weekly" and current_date.weekday() == 0:  # Mondays
-                should_apply = True
-            elif freq == "semi-monthly" and current_date.day in [1, 15]:
-                should_apply = True
-            elif freq == "monthly" and current_date.day == 1:
-                should_apply = True
-            elif freq == "quarterly" and current_date.day == 1 and current_date.month in [1, 4, 7, 10]:
-                should_apply = True
-            
-            if should_apply:
-                if avg > 0:
-                    daily_credits += avg
-                else:
-                    daily_debits += abs(avg)
-                transactions_today.append({
-                    "name": grp["name"],
-                    "amount": avg,
-                    "type": "credit" if avg > 0 else "debit"
-                })
-        
-        balance = balance + daily_credits - daily_debits
-        
-        forecast_rows.append({
-            "date": current_date.strftime("%Y-%m-%d"),
-            "day_name": day_name,
-            "balance": round(balance, 2),
-            "credits": round(daily_credits, 2),
-            "debits": round(daily_debits, 2),
-            "transactions": transactions_today
-        })
+    # Build forecast model from groups, off the event loop
+    forecast_rows, low_idx, high_idx = await asyncio.to_thread(
+        build_forecast, list(groups[company_id]), companies[company_id].get("current_balance", 0), days
+    )
     
-    # Find high/low points
-    balances = [r["balance"] for r in forecast_rows]
-    low_idx = balances.index(min(balances))
-    high_idx = balances.index(max(balances))
-    
-    return {
+    return orjson_response({
         "forecast": forecast_rows,
         "summary": {
             "current_balance": companies[company_id].get("current_balance", 0),
@@ -515,7 +597,85 @@ async def get_forecast(company_id: str, days: int = 30):
                 "date": forecast_rows[high_idx]["date"]
             }
         }
-    }
+    })
+
+def build_forecast(company_groups: list, start_balance: float, days: int) -> tuple:
+    """Project daily balances from confirmed groups over the next `days` days.
+    
+    Returns (rows, low_idx, high_idx) where the indexes point at the lowest and
+    highest balance rows.
+    """
+    today = np.datetime64(datetime.now().date(), "D")
+    dates = np.arange(today, today + days)
+    weekday = (dates.astype(np.int64) + 3) % 7  # 1970-01-01 was a Thursday; Monday == 0
+    months = dates.astype("datetime64[M]")
+    day_of_month = (dates - months).astype(np.int64) + 1
+    month = months.astype(np.int64) % 12 + 1
+    
+    credits = np.zeros(days)
+    debits = np.zeros(days)
+    transactions_by_day = [[] for _ in range(days)]
+    masks = {}  # frequency -> active-day mask, shared by groups with that frequency
+    
+    # Apply each group based on frequency
+    for grp in company_groups:
+        if not grp.get("confirmed", False):
+            continue
+        
+        freq = grp["frequency"]
+        if freq not in masks:
+            masks[freq] = _freq_mask(freq, weekday, day_of_month, month)
+        active = masks[freq]
+        
+        avg = grp["avg_amount"]
+        if avg > 0:
+            credits[active] += avg
+        else:
+            debits[active] += abs(avg)
+        
+        entry = {
+            "name": grp["name"],
+            "amount": avg,
+            "type": "credit" if avg > 0 else "debit"
+        }
+        for i in np.flatnonzero(active).tolist():
+            transactions_by_day[i].append(entry)
+    
+    balance = start_balance + np.cumsum(credits - debits)
+    
+    # Find high/low points on the same rounded balances the rows show
+    shown_balance = np.array([round(bal, 2) for bal in balance.tolist()])
+    low_idx = int(np.argmin(shown_balance))
+    high_idx = int(np.argmax(shown_balance))
+    
+    rows = [
+        {
+            "date": date,
+            "day_name": _DAY_NAMES[dow],
+            "balance": bal,
+            "credits": round(cr, 2),
+            "debits": round(db, 2),
+            "transactions": txns_today
+        }
+        for date, dow, bal, cr, db, txns_today in zip(
+            np.datetime_as_string(dates).tolist(), weekday.tolist(),
+            shown_balance.tolist(), credits.tolist(), debits.tolist(), transactions_by_day)
+    ]
+    return rows, low_idx, high_idx
+
+def _freq_mask(freq: str, weekday, day_of_month, month):
+    """Boolean mask of the forecast days a group with this frequency lands on"""
+    if freq == "daily":
+        return weekday < 5
+    if freq == "weekly":
+        return weekday == 0  # Mondays
+    if freq == "semi-monthly":
+        return (day_of_month == 1) | (day_of_month == 15)
+    if freq == "monthly":
+        return day_of_month == 1
+    if freq == "quarterly":
+        return (day_of_month == 1) & np.isin(month, [1, 4, 7, 10])
+    return np.zeros(len(weekday), dtype=bool)
 
 # ============================================================================
 # TREND ANALYSIS
@@ -527,48 +687,56 @@ async def get_trends(company_id: str):
     if company_id not in transactions:
         raise HTTPException(status_code=404, detail="Company not found")
     
-    txns = transactions[company_id]
+    cols = txn_columns[company_id]
+    dates = cols["date"]
+    amounts = cols["amount"]
     
-    # Group by week and analyze
-    weekly_totals = defaultdict(lambda: {"credits": 0, "debits": 0})
+    # ISO week number: the week belongs to the year its Thursday falls in
+    weekday = (dates.astype(np.int64) + 3) % 7  # Monday == 0
+    thursday = dates + (3 - weekday)
+    week_of = (thursday - thursday.astype("datetime64[Y]")).astype(np.int64) // 7 + 1
     
-    for txn in txns:
-        week = datetime.strptime(txn["date"], "%Y-%m-%d").isocalendar()[1]
-        if txn["amount"] > 0:
-            weekly_totals[week]["credits"] += txn["amount"]
-        else:
-            weekly_totals[week]["debits"] += abs(txn["amount"])
+    # Group by week and analyze
+    txn_counts = np.bincount(week_of, minlength=54)
+    weekly_credits = np.bincount(week_of, weights=np.where(amounts > 0, amounts, 0.0), minlength=54)
+    weekly_debits = np.bincount(week_of, weights=np.where(amounts > 0, 0.0, np.abs(amounts)), minlength=54)
     
-    weeks = sorted(weekly_totals.keys())
+    weeks = np.flatnonzero(txn_counts)
+    credits = weekly_credits[weeks]
+    debits = weekly_debits[weeks]
+    half = len(weeks) // 2
     
     # Calculate trends
     credit_trend = "stable"
     debit_trend = "stable"
     
     if len(weeks) >= 4:
-        first_half_credits = sum(weekly_totals[w]["credits"] for w in weeks[:len(weeks)//2])
-        second_half_credits = sum(weekly_totals[w]["credits"] for w in weeks[len(weeks)//2:])
+        first_half_credits = credits[:half].sum()
+        second_half_credits = credits[half:].sum()
         
         if second_half_credits > first_half_credits * 1.1:
             credit_trend = "increasing"
         elif second_half_credits < first_half_credits * 0.9:
             credit_trend = "decreasing"
         
-        first_half_debits = sum(weekly_totals[w]["debits"] for w in weeks[:len(weeks)//2])
-        second_half_debits = sum(weekly_totals[w]["debits"] for w in weeks[len(weeks)//2:])
+        first_half_debits = debits[:half].sum()
+        second_half_debits = debits[half:].sum()
         
         if second_half_debits > first_half_debits * 1.1:
             debit_trend = "increasing"
         elif second_half_debits < first_half_debits * 0.9:
             debit_trend = "decreasing"
     
-    return {
-        "weekly_data": [{"week": w, **weekly_totals[w]} for w in weeks],
+    return orjson_response({
+        "weekly_data": [
+            {"week": w, "credits": c, "debits": d}
+            for w, c, d in zip(weeks.tolist(), credits.tolist(), debits.tolist())
+        ],
         "trends": {
             "revenue": credit_trend,
             "expenses": debit_trend
         }
-    }
+    })
 
 @app.post("/api/company/{company_id}/trend-sentiment")
 async def set_trend_sentiment(company_id: str, request: Request):
@@ -594,13 +762,28 @@ async def set_balance(company_id: str, request: Request):
 # STATIC FILES & FRONTEND
 # ============================================================================
 
+# The frontend is a single static page, read it once instead of on every request
+_INDEX_HTML = Path("/app/static/index.html").read_bytes()
+_INDEX_ETAG = f'"{hashlib.sha1(_INDEX_HTML).hexdigest()}"'
+
 @app.get("/", response_class=HTMLResponse)
-async def root():
-    return open("/app/static/index.html").read()
+async def root(request: Request):
+    if request.headers.get("if-none-match") == _INDEX_ETAG:
+        return Response(status_code=304, headers={"etag": _INDEX_ETAG})
+    return HTMLResponse(_INDEX_HTML, headers={"etag": _INDEX_ETAG})
 
 # Mount static files
 app.mount("/static", StaticFiles(directory="/app/static"), name="static")
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=int(os.getenv("PORT", 8000)))
+    # Companies, transactions and groups live in this process's dicts, so this
+    # stays a single worker until the PostgreSQL backend exists.
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", 8000)),
+        http="httptools",
+        log_level="warning",
+        access_log=False,
+    )